@@ -6,10 +6,13 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Protocol
+import asyncio
+import errno
+import os
 import shutil
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentIdentity:
     npc_name: str
     character_card_path: Path
@@ -29,7 +32,7 @@ class IdentityRefreshHook(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HotSwapResult:
     old_identity: AgentIdentity
     new_identity: AgentIdentity
@@ -54,18 +57,25 @@ class AgentIdentityManager:
         self._data_home = data_home.expanduser()
         self._current_identity = initial_identity
         self._identity_hook = identity_hook
+        self._swap_lock = asyncio.Lock()
 
     @property
     def current_identity(self) -> AgentIdentity:
         return self._current_identity
 
     async def hot_swap(self, new_identity: AgentIdentity) -> HotSwapResult:
+        # Archive naming and the rename run in worker threads; serialize swaps so
+        # two of them cannot race on the same agent root or archive name.
+        async with self._swap_lock:
+            return await self._hot_swap(new_identity)
+
+    async def _hot_swap(self, new_identity: AgentIdentity) -> HotSwapResult:
         old_identity = self._current_identity
         old_root = self._agent_root(old_identity.npc_name)
         new_root = self._agent_root(new_identity.npc_name)
 
-        archive_dir = self._archive_old_agent_root(old_identity, old_root)
-        self._bootstrap_new_agent_root(new_root)
+        archive_dir = await asyncio.to_thread(self._archive_old_agent_root, old_identity, old_root)
+        await asyncio.to_thread(self._bootstrap_new_agent_root, new_root)
 
         if self._identity_hook is not None:
             try:
@@ -88,9 +98,20 @@ class AgentIdentityManager:
             return None
 
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        archive_dir = self._data_home / "archive" / f"{old_identity.npc_name}-{timestamp}"
-        archive_dir.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(old_root), str(archive_dir))
+        archive_root = self._data_home / "archive"
+        archive_name = f"{old_identity.npc_name}-{timestamp}"
+        archive_dir = archive_root / archive_name
+        suffix = 1
+        while archive_dir.exists():
+            archive_dir = archive_root / f"{archive_name}-{suffix}"
+            suffix += 1
+        archive_root.mkdir(parents=True, exist_ok=True)
+        try:
+            os.rename(old_root, archive_dir)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            shutil.move(str(old_root), str(archive_dir))
         return archive_dir
 
     def _bootstrap_new_agent_root(self, root: Path) -> None:
@@ -104,8 +125,11 @@ class AgentIdentityManager:
         qmd_cache.mkdir(parents=True, exist_ok=True)
 
         curated_memory = memory_root / "MEMORY.md"
-        if not curated_memory.exists():
-            curated_memory.write_text("# MEMORY\n\n", encoding="utf-8")
+        try:
+            with curated_memory.open("x", encoding="utf-8") as handle:
+                handle.write("# MEMORY\n\n")
+        except FileExistsError:
+            pass
 
     def _agent_root(self, npc_name: str) -> Path:
         return self._data_home / "agents" / npc_name.strip()
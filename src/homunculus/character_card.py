@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Mapping, Sequence, Tuple
 import json
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads
+
 
 _REQUIRED_TOP_LEVEL_FIELDS = (
     "name",
@@ -17,6 +23,7 @@ _REQUIRED_TOP_LEVEL_FIELDS = (
     "skills",
     "inventory",
 )
+_STRING_FIELDS = ("name", "description", "personality", "background")
 _REQUIRED_STATS_FIELDS = (
     "STR",
     "CON",
@@ -30,9 +37,12 @@ _REQUIRED_STATS_FIELDS = (
     "SAN",
     "MP",
 )
+_REQUIRED_TOP_LEVEL_FIELDS_SET = frozenset(_REQUIRED_TOP_LEVEL_FIELDS)
+_REQUIRED_STATS_FIELDS_SET = frozenset(_REQUIRED_STATS_FIELDS)
+_ISSUE_SORT_KEY = attrgetter("field", "code", "message")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     field: str
     code: str
@@ -43,7 +53,7 @@ class CharacterCardValidationError(ValueError):
     """Raised when character card validation fails."""
 
     def __init__(self, issues: Sequence[ValidationIssue]):
-        normalized = tuple(sorted(issues, key=lambda item: (item.field, item.code, item.message)))
+        normalized = tuple(issues) if len(issues) <= 1 else tuple(sorted(issues, key=_ISSUE_SORT_KEY))
         if not normalized:
             raise ValueError("CharacterCardValidationError requires at least one issue.")
 
@@ -54,7 +64,7 @@ class CharacterCardValidationError(ValueError):
         super().__init__(f"CharacterCard validation failed: {formatted}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CharacterCard:
     name: str
     description: str
@@ -73,8 +83,7 @@ def load_character_card(path: Path) -> CharacterCard:
         )
 
     try:
-        with resolved.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = _json_loads(resolved.read_bytes())
     except json.JSONDecodeError as exc:
         raise CharacterCardValidationError(
             [ValidationIssue("file", "invalid_json", f"Character card is not valid JSON: {resolved}")]
@@ -90,30 +99,19 @@ def parse_character_card(payload: Any) -> CharacterCard:
             [ValidationIssue("$", "invalid_type", "Character card root must be an object.")]
         )
 
-    unknown_fields = sorted(set(payload.keys()) - set(_REQUIRED_TOP_LEVEL_FIELDS))
+    payload_keys = payload.keys()
+    unknown_fields = sorted(payload_keys - _REQUIRED_TOP_LEVEL_FIELDS_SET)
     for field in unknown_fields:
         issues.append(ValidationIssue(field, "unknown_field", "Unknown field is not allowed."))
 
-    missing_fields = sorted(set(_REQUIRED_TOP_LEVEL_FIELDS) - set(payload.keys()))
+    missing_fields = sorted(_REQUIRED_TOP_LEVEL_FIELDS_SET - payload_keys)
     for field in missing_fields:
         issues.append(ValidationIssue(field, "missing_field", "Required field is missing."))
 
-    name = _validate_non_empty_string("name", payload.get("name"), issues) if "name" in payload else ""
-    description = (
-        _validate_non_empty_string("description", payload.get("description"), issues)
-        if "description" in payload
-        else ""
-    )
-    personality = (
-        _validate_non_empty_string("personality", payload.get("personality"), issues)
-        if "personality" in payload
-        else ""
-    )
-    background = (
-        _validate_non_empty_string("background", payload.get("background"), issues)
-        if "background" in payload
-        else ""
-    )
+    strings = {
+        field: _validate_non_empty_string(field, payload[field], issues) if field in payload else ""
+        for field in _STRING_FIELDS
+    }
 
     stats = _validate_stats(payload.get("stats"), issues) if "stats" in payload else {}
     skills = _validate_skills(payload.get("skills"), issues) if "skills" in payload else {}
@@ -123,10 +121,7 @@ def parse_character_card(payload: Any) -> CharacterCard:
         raise CharacterCardValidationError(issues)
 
     return CharacterCard(
-        name=name,
-        description=description,
-        personality=personality,
-        background=background,
+        **strings,
         stats=stats,
         skills=skills,
         inventory=inventory,
@@ -151,11 +146,12 @@ def _validate_stats(value: Any, issues: list) -> Mapping[str, int]:
         issues.append(ValidationIssue("stats", "invalid_type", "Expected an object for stats."))
         return {}
 
-    unknown = sorted(set(value.keys()) - set(_REQUIRED_STATS_FIELDS))
+    stat_keys = value.keys()
+    unknown = sorted(stat_keys - _REQUIRED_STATS_FIELDS_SET)
     for key in unknown:
         issues.append(ValidationIssue(f"stats.{key}", "unknown_field", "Unknown stat is not allowed."))
 
-    missing = sorted(set(_REQUIRED_STATS_FIELDS) - set(value.keys()))
+    missing = sorted(_REQUIRED_STATS_FIELDS_SET - stat_keys)
     for key in missing:
         issues.append(ValidationIssue(f"stats.{key}", "missing_field", "Required stat is missing."))
 
@@ -221,17 +217,22 @@ def _validate_inventory(value: Any, issues: list) -> Tuple[str, ...]:
         return ()
 
     inventory = []
+    append = inventory.append
     for idx, item in enumerate(value):
-        field = f"inventory[{idx}]"
+        # Field labels are only formatted on the error paths.
         if not isinstance(item, str):
-            issues.append(ValidationIssue(field, "invalid_type", "Inventory item must be a string."))
+            issues.append(
+                ValidationIssue(f"inventory[{idx}]", "invalid_type", "Inventory item must be a string.")
+            )
             continue
 
         normalized = item.strip()
         if not normalized:
-            issues.append(ValidationIssue(field, "empty_string", "Inventory item cannot be empty."))
+            issues.append(
+                ValidationIssue(f"inventory[{idx}]", "empty_string", "Inventory item cannot be empty.")
+            )
             continue
-        inventory.append(normalized)
+        append(normalized)
     return tuple(inventory)
 
 
@@ -6,11 +6,10 @@ from pathlib import Path
 from typing import Optional, Sequence
 import argparse
 import asyncio
-import json
 import sys
 
 from homunculus import __version__
-from homunculus.config.settings import SettingsError, load_settings, settings_summary
+from homunculus.config.settings import SettingsError, load_settings, settings_summary_json
 from homunculus.runtime.app import run_runtime
 
 
@@ -50,7 +49,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         return 2
 
     if args.check:
-        print(json.dumps(settings_summary(settings), indent=2, sort_keys=True))
+        print(settings_summary_json(settings).decode("utf-8"))
         return 0
 
     shutdown_event = None
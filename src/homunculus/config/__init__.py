@@ -9,10 +9,12 @@ from homunculus.config.settings import (
     ModelSettings,
     RuntimeSettings,
     SettingsError,
+    clear_settings_cache,
     load_settings,
     migrate_legacy_config,
     resolve_env_secret,
     settings_summary,
+    settings_summary_json,
 )
 
 __all__ = [
@@ -24,8 +26,10 @@ __all__ = [
     "ModelSettings",
     "RuntimeSettings",
     "SettingsError",
+    "clear_settings_cache",
     "load_settings",
     "migrate_legacy_config",
     "resolve_env_secret",
     "settings_summary",
+    "settings_summary_json",
 ]
@@ -3,21 +3,49 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Mapping, Optional, Tuple
+from typing import Any, Callable, FrozenSet, Mapping, Optional, Tuple
 import json
 import os
+import sys
+
+try:
+    from orjson import OPT_INDENT_2, OPT_SORT_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads
+
+    _orjson_dumps = None
 
 
 _MISSING = object()
-_VALID_LOG_LEVELS = {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"}
+_ENV_PREFIX = "HOMUNCULUS_"
+_CONFIG_SECTIONS = ("agent", "discord", "model", "memory", "runtime")
+_VALID_LOG_LEVELS = frozenset({"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"})
+_INVALID_LOG_LEVEL_MESSAGE = "runtime.log_level must be one of: " + ", ".join(
+    sorted(_VALID_LOG_LEVELS)
+)
+_VALID_PROVIDERS = frozenset({"anthropic", "openai", "openclaw"})
+_INVALID_PROVIDER_MESSAGE = "model.provider must be 'anthropic', 'openai', or 'openclaw'."
+_BOOL_VALUES = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+}
 
 
 class SettingsError(ValueError):
     """Raised when settings cannot be loaded or validated."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChannelSettings:
     channel_id: int
     character_card_path: Path
@@ -28,26 +56,13 @@ class ChannelSettings:
     def __post_init__(self) -> None:
         if self.channel_id <= 0:
             raise SettingsError("discord.channels[].channel_id must be a positive integer.")
-
-        channel_name = self.channel_name.strip()
-        memory_namespace = self.memory_namespace.strip()
-        skill_ruleset = self.skill_ruleset.strip()
-        card_path = self.character_card_path.expanduser()
-
-        if not memory_namespace:
+        if not self.memory_namespace.strip():
             raise SettingsError("discord.channels[].memory_namespace cannot be empty.")
-        if not skill_ruleset:
+        if not self.skill_ruleset.strip():
             raise SettingsError("discord.channels[].skill_ruleset cannot be empty.")
-        if not str(card_path):
-            raise SettingsError("discord.channels[].character_card_path cannot be empty.")
-
-        object.__setattr__(self, "channel_name", channel_name)
-        object.__setattr__(self, "memory_namespace", memory_namespace)
-        object.__setattr__(self, "skill_ruleset", skill_ruleset)
-        object.__setattr__(self, "character_card_path", card_path)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentSettings:
     npc_name: str
     character_card_path: Path
@@ -56,34 +71,17 @@ class AgentSettings:
     bot_name: str = ""
 
     def __post_init__(self) -> None:
-        npc_name = self.npc_name.strip()
-        if not npc_name:
+        if not self.npc_name.strip():
             raise SettingsError("agent.npc_name cannot be empty.")
-
-        qmd_index = self.qmd_index.strip()
-        if not qmd_index:
+        if not self.qmd_index.strip():
             raise SettingsError("agent.qmd_index cannot be empty.")
-
-        skill_ruleset = self.skill_ruleset.strip()
-        if not skill_ruleset:
+        if not self.skill_ruleset.strip():
             raise SettingsError("agent.skill_ruleset cannot be empty.")
-
-        card_path = self.character_card_path.expanduser()
-        if not str(card_path):
-            raise SettingsError("agent.character_card_path cannot be empty.")
-
-        bot_name = self.bot_name.strip()
-        if not bot_name:
+        if not self.bot_name.strip():
             raise SettingsError("agent.bot_name cannot be empty.")
 
-        object.__setattr__(self, "npc_name", npc_name)
-        object.__setattr__(self, "qmd_index", qmd_index)
-        object.__setattr__(self, "skill_ruleset", skill_ruleset)
-        object.__setattr__(self, "character_card_path", card_path)
-        object.__setattr__(self, "bot_name", bot_name)
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscordSettings:
     channels: Tuple[ChannelSettings, ...]
     bot_token_env: str = "DISCORD_BOT_TOKEN"
@@ -96,8 +94,7 @@ class DiscordSettings:
         if self.history_size <= 0:
             raise SettingsError("discord.history_size must be a positive integer.")
 
-        bot_token_env = self.bot_token_env.strip()
-        if not bot_token_env:
+        if not self.bot_token_env.strip():
             raise SettingsError("discord.bot_token_env cannot be empty.")
 
         seen_ids = set()
@@ -108,8 +105,6 @@ class DiscordSettings:
                 )
             seen_ids.add(channel.channel_id)
 
-        object.__setattr__(self, "bot_token_env", bot_token_env)
-
     @property
     def channel_id(self) -> int:
         """Backward-compatible primary channel access."""
@@ -120,7 +115,7 @@ class DiscordSettings:
         return tuple(channel.channel_id for channel in self.channels)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelSettings:
     provider: str
     name: str
@@ -132,16 +127,13 @@ class ModelSettings:
     agent_id: Optional[str] = None
 
     def __post_init__(self) -> None:
-        provider = self.provider.strip().lower()
-        if provider not in ("anthropic", "openai", "openclaw"):
-            raise SettingsError("model.provider must be 'anthropic', 'openai', or 'openclaw'.")
+        if self.provider not in _VALID_PROVIDERS:
+            raise SettingsError(_INVALID_PROVIDER_MESSAGE)
 
-        name = self.name.strip()
-        if not name:
+        if not self.name.strip():
             raise SettingsError("model.name cannot be empty.")
 
-        api_key_env = self.api_key_env.strip()
-        if not api_key_env:
+        if not self.api_key_env.strip():
             raise SettingsError("model.api_key_env cannot be empty.")
 
         if self.max_tokens <= 0:
@@ -153,22 +145,8 @@ class ModelSettings:
         if self.timeout_seconds <= 0:
             raise SettingsError("model.timeout_seconds must be > 0.")
 
-        base_url = self.base_url.strip() if self.base_url else None
-        if base_url == "":
-            base_url = None
-
-        agent_id = self.agent_id.strip() if self.agent_id else None
-        if agent_id == "":
-            agent_id = None
-
-        object.__setattr__(self, "provider", provider)
-        object.__setattr__(self, "name", name)
-        object.__setattr__(self, "api_key_env", api_key_env)
-        object.__setattr__(self, "base_url", base_url)
-        object.__setattr__(self, "agent_id", agent_id)
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemorySettings:
     qmd_binary: str = "qmd"
     top_k: int = 10
@@ -176,10 +154,10 @@ class MemorySettings:
     fallback_timeout_seconds: float = 2.0
     update_interval_seconds: float = 300.0
     update_timeout_seconds: float = 60.0
+    retrieval_cache_ttl_seconds: float = 30.0
 
     def __post_init__(self) -> None:
-        qmd_binary = self.qmd_binary.strip()
-        if not qmd_binary:
+        if not self.qmd_binary.strip():
             raise SettingsError("memory.qmd_binary cannot be empty.")
 
         if self.top_k <= 0:
@@ -197,27 +175,22 @@ class MemorySettings:
         if self.update_timeout_seconds <= 0:
             raise SettingsError("memory.update_timeout_seconds must be > 0.")
 
-        object.__setattr__(self, "qmd_binary", qmd_binary)
+        if self.retrieval_cache_ttl_seconds < 0:
+            raise SettingsError("memory.retrieval_cache_ttl_seconds must be >= 0.")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeSettings:
     log_level: str = "INFO"
     data_home: Path = Path("~/.homunculus")
     dry_run: bool = False
 
     def __post_init__(self) -> None:
-        log_level = self.log_level.strip().upper()
-        if log_level not in _VALID_LOG_LEVELS:
-            raise SettingsError(
-                "runtime.log_level must be one of: " + ", ".join(sorted(_VALID_LOG_LEVELS))
-            )
-
-        object.__setattr__(self, "log_level", log_level)
-        object.__setattr__(self, "data_home", self.data_home.expanduser())
+        if self.log_level not in _VALID_LOG_LEVELS:
+            raise SettingsError(_INVALID_LOG_LEVEL_MESSAGE)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     agent: AgentSettings
     discord: DiscordSettings
@@ -244,11 +217,46 @@ def load_settings(
     config_path: Optional[Path] = None,
     environ: Optional[Mapping[str, str]] = None,
 ) -> AppSettings:
-    """Load validated settings from JSON config and environment overrides."""
+    """Load validated settings from JSON config and environment overrides.
+
+    Results are memoized on the config file identity (path, mtime, size) and the
+    ``HOMUNCULUS_*`` environment entries; call ``clear_settings_cache()`` to
+    force a re-read. On filesystems with coarse mtime resolution, an edit that
+    keeps the file size unchanged may not be noticed until the cache is cleared.
+    """
+
+    env = environ if environ is not None else os.environ
+    env_items = frozenset(
+        (key, value) for key, value in env.items() if key.startswith(_ENV_PREFIX)
+    )
+    return _build_settings(_config_cache_key(config_path), env_items)
+
+
+def _config_cache_key(config_path: Optional[Path]) -> Optional[Tuple[Path, int, int]]:
+    if config_path is None:
+        return None
+
+    resolved = config_path.expanduser()
+    try:
+        stat = resolved.stat()
+    except FileNotFoundError:
+        raise SettingsError(f"Config file does not exist: {resolved}") from None
+    return resolved.absolute(), stat.st_mtime_ns, stat.st_size
 
-    env = dict(environ) if environ is not None else dict(os.environ)
-    config = migrate_legacy_config(_load_config(config_path))
-    discord = _load_discord_settings(config=config, environ=env)
+
+@lru_cache(maxsize=4)
+def _build_settings(
+    config_key: Optional[Tuple[Path, int, int]],
+    env_items: FrozenSet[Tuple[str, str]],
+) -> AppSettings:
+    env = dict(env_items)
+    config = _config_sections(
+        migrate_legacy_config(_load_config(config_key[0] if config_key else None))
+    )
+    discord = DiscordSettings(
+        channels=_load_channel_settings(config=config, environ=env),
+        **_read_section(config, env, "discord"),
+    )
     primary_channel = discord.channels[0]
 
     qmd_index = _read_value(
@@ -302,166 +310,9 @@ def load_settings(
         ),
     )
 
-    model = ModelSettings(
-        provider=_read_value(
-            config,
-            env,
-            section="model",
-            key="provider",
-            env_key="HOMUNCULUS_MODEL_PROVIDER",
-            caster=_as_str,
-            default="anthropic",
-        ),
-        name=_read_value(
-            config,
-            env,
-            section="model",
-            key="name",
-            env_key="HOMUNCULUS_MODEL_NAME",
-            caster=_as_str,
-        ),
-        api_key_env=_read_value(
-            config,
-            env,
-            section="model",
-            key="api_key_env",
-            env_key="HOMUNCULUS_MODEL_API_KEY_ENV",
-            caster=_as_str,
-            default="ANTHROPIC_API_KEY",
-        ),
-        max_tokens=_read_value(
-            config,
-            env,
-            section="model",
-            key="max_tokens",
-            env_key="HOMUNCULUS_MODEL_MAX_TOKENS",
-            caster=_as_int,
-            default=500,
-        ),
-        temperature=_read_value(
-            config,
-            env,
-            section="model",
-            key="temperature",
-            env_key="HOMUNCULUS_MODEL_TEMPERATURE",
-            caster=_as_float,
-            default=0.7,
-        ),
-        timeout_seconds=_read_value(
-            config,
-            env,
-            section="model",
-            key="timeout_seconds",
-            env_key="HOMUNCULUS_MODEL_TIMEOUT_SECONDS",
-            caster=_as_float,
-            default=30.0,
-        ),
-        base_url=_read_value(
-            config,
-            env,
-            section="model",
-            key="base_url",
-            env_key="HOMUNCULUS_MODEL_BASE_URL",
-            caster=_as_optional_str,
-            default=None,
-        ),
-        agent_id=_read_value(
-            config,
-            env,
-            section="model",
-            key="agent_id",
-            env_key="HOMUNCULUS_MODEL_AGENT_ID",
-            caster=_as_optional_str,
-            default=None,
-        ),
-    )
-
-    memory = MemorySettings(
-        qmd_binary=_read_value(
-            config,
-            env,
-            section="memory",
-            key="qmd_binary",
-            env_key="HOMUNCULUS_MEMORY_QMD_BINARY",
-            caster=_as_str,
-            default="qmd",
-        ),
-        top_k=_read_value(
-            config,
-            env,
-            section="memory",
-            key="top_k",
-            env_key="HOMUNCULUS_MEMORY_TOP_K",
-            caster=_as_int,
-            default=10,
-        ),
-        query_timeout_seconds=_read_value(
-            config,
-            env,
-            section="memory",
-            key="query_timeout_seconds",
-            env_key="HOMUNCULUS_MEMORY_QUERY_TIMEOUT_SECONDS",
-            caster=_as_float,
-            default=4.0,
-        ),
-        fallback_timeout_seconds=_read_value(
-            config,
-            env,
-            section="memory",
-            key="fallback_timeout_seconds",
-            env_key="HOMUNCULUS_MEMORY_FALLBACK_TIMEOUT_SECONDS",
-            caster=_as_float,
-            default=2.0,
-        ),
-        update_interval_seconds=_read_value(
-            config,
-            env,
-            section="memory",
-            key="update_interval_seconds",
-            env_key="HOMUNCULUS_MEMORY_UPDATE_INTERVAL_SECONDS",
-            caster=_as_float,
-            default=300.0,
-        ),
-        update_timeout_seconds=_read_value(
-            config,
-            env,
-            section="memory",
-            key="update_timeout_seconds",
-            env_key="HOMUNCULUS_MEMORY_UPDATE_TIMEOUT_SECONDS",
-            caster=_as_float,
-            default=60.0,
-        ),
-    )
-
-    runtime = RuntimeSettings(
-        log_level=_read_value(
-            config,
-            env,
-            section="runtime",
-            key="log_level",
-            env_key="HOMUNCULUS_RUNTIME_LOG_LEVEL",
-            caster=_as_str,
-            default="INFO",
-        ),
-        data_home=_read_value(
-            config,
-            env,
-            section="runtime",
-            key="data_home",
-            env_key="HOMUNCULUS_RUNTIME_DATA_HOME",
-            caster=_as_path,
-            default=Path("~/.homunculus"),
-        ),
-        dry_run=_read_value(
-            config,
-            env,
-            section="runtime",
-            key="dry_run",
-            env_key="HOMUNCULUS_RUNTIME_DRY_RUN",
-            caster=_as_bool,
-            default=False,
-        ),
-    )
+    model = ModelSettings(**_read_section(config, env, "model"))
+    memory = MemorySettings(**_read_section(config, env, "memory"))
+    runtime = RuntimeSettings(**_read_section(config, env, "runtime"))
 
     return AppSettings(
         agent=agent,
@@ -472,6 +323,12 @@ def load_settings(
     )
 
 
+def clear_settings_cache() -> None:
+    """Drop memoized settings so the next ``load_settings`` call re-reads inputs."""
+
+    _build_settings.cache_clear()
+
+
 def migrate_legacy_config(config: Mapping[str, Any]) -> dict[str, Any]:
     """Convert v0.1 single-channel config into v0.2 channel list shape."""
 
@@ -546,35 +403,35 @@ def settings_summary(settings: AppSettings) -> dict:
                 }
                 for channel in settings.discord.channels
             ],
-            "bot_token_env": settings.discord.bot_token_env,
-            "history_size": settings.discord.history_size,
-        },
-        "model": {
-            "provider": settings.model.provider,
-            "name": settings.model.name,
-            "api_key_env": settings.model.api_key_env,
-            "max_tokens": settings.model.max_tokens,
-            "temperature": settings.model.temperature,
-            "timeout_seconds": settings.model.timeout_seconds,
-            "base_url": settings.model.base_url,
-            "agent_id": settings.model.agent_id,
-        },
-        "memory": {
-            "qmd_binary": settings.memory.qmd_binary,
-            "top_k": settings.memory.top_k,
-            "query_timeout_seconds": settings.memory.query_timeout_seconds,
-            "fallback_timeout_seconds": settings.memory.fallback_timeout_seconds,
-            "update_interval_seconds": settings.memory.update_interval_seconds,
-            "update_timeout_seconds": settings.memory.update_timeout_seconds,
-        },
-        "runtime": {
-            "log_level": settings.runtime.log_level,
-            "data_home": str(settings.runtime.data_home),
-            "dry_run": settings.runtime.dry_run,
+            **_summarize_fields(settings.discord, "discord"),
         },
+        "model": _summarize_fields(settings.model, "model"),
+        "memory": _summarize_fields(settings.memory, "memory"),
+        "runtime": _summarize_fields(settings.runtime, "runtime"),
     }
 
 
+def _summarize_fields(section_settings: Any, section: str) -> dict[str, Any]:
+    summary: dict[str, Any] = {}
+    for key, *_ in _SECTION_FIELDS[section]:
+        value = getattr(section_settings, key)
+        summary[key] = str(value) if isinstance(value, Path) else value
+    return summary
+
+
+@lru_cache(maxsize=4)
+def settings_summary_json(settings: AppSettings) -> bytes:
+    """Render the redacted summary as indented, key-sorted UTF-8 JSON.
+
+    Settings are immutable, so the encoded bytes are memoized per instance.
+    """
+
+    summary = settings_summary(settings)
+    if _orjson_dumps is not None:
+        return _orjson_dumps(summary, option=OPT_INDENT_2 | OPT_SORT_KEYS)
+    return json.dumps(summary, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
 def _load_config(config_path: Optional[Path]) -> Mapping[str, Any]:
     if config_path is None:
         return {}
@@ -584,8 +441,7 @@ def _load_config(config_path: Optional[Path]) -> Mapping[str, Any]:
         raise SettingsError(f"Config file does not exist: {resolved}")
 
     try:
-        with resolved.open("r", encoding="utf-8") as handle:
-            loaded = json.load(handle)
+        loaded = _json_loads(resolved.read_bytes())
     except json.JSONDecodeError as exc:
         raise SettingsError(f"Config file is not valid JSON: {resolved}") from exc
 
@@ -595,33 +451,16 @@ def _load_config(config_path: Optional[Path]) -> Mapping[str, Any]:
     return loaded
 
 
-def _load_discord_settings(
-    *,
-    config: Mapping[str, Any],
-    environ: Mapping[str, str],
-) -> DiscordSettings:
-    channels = _load_channel_settings(config=config, environ=environ)
-    return DiscordSettings(
-        channels=channels,
-        bot_token_env=_read_value(
-            config,
-            environ,
-            section="discord",
-            key="bot_token_env",
-            env_key="HOMUNCULUS_DISCORD_BOT_TOKEN_ENV",
-            caster=_as_str,
-            default="DISCORD_BOT_TOKEN",
-        ),
-        history_size=_read_value(
-            config,
-            environ,
-            section="discord",
-            key="history_size",
-            env_key="HOMUNCULUS_DISCORD_HISTORY_SIZE",
-            caster=_as_int,
-            default=25,
-        ),
-    )
+def _config_sections(config: Mapping[str, Any]) -> dict[str, Mapping[str, Any]]:
+    sections = {}
+    for section in _CONFIG_SECTIONS:
+        section_map = config.get(section)
+        if section_map is None:
+            continue
+        if not isinstance(section_map, Mapping):
+            raise SettingsError(f"Config section '{section}' must be an object.")
+        sections[section] = section_map
+    return sections
 
 
 def _load_channel_settings(
@@ -735,7 +574,7 @@ def _cast_channel_value(
         return caster(raw)
     except SettingsError:
         raise
-    except Exception as exc:
+    except (ValueError, OverflowError) as exc:
         raise SettingsError(
             f"Invalid value for discord.channels[{index}].{key}: {raw!r}"
         ) from exc
@@ -821,12 +660,31 @@ def _read_value(
         return caster(raw_value)
     except SettingsError:
         raise
-    except Exception as exc:  # pragma: no cover - defensive
+    except (ValueError, OverflowError) as exc:
         raise SettingsError(
             f"Invalid value for {section}.{key} from {source}: {raw_value!r}"
         ) from exc
 
 
+def _read_section(
+    config: Mapping[str, Any],
+    environ: Mapping[str, str],
+    section: str,
+) -> dict[str, Any]:
+    return {
+        key: _read_value(
+            config,
+            environ,
+            section=section,
+            key=key,
+            env_key=env_key,
+            caster=caster,
+            default=default,
+        )
+        for key, env_key, caster, default in _SECTION_FIELDS[section]
+    }
+
+
 def _resolve_raw_value(
     *,
     config: Mapping[str, Any],
@@ -841,10 +699,7 @@ def _resolve_raw_value(
         return env_value, "environment"
 
     section_map = config.get(section)
-    if section_map is not None and not isinstance(section_map, Mapping):
-        raise SettingsError(f"Config section '{section}' must be an object.")
-
-    if isinstance(section_map, Mapping) and key in section_map:
+    if section_map is not None and key in section_map:
         return section_map[key], "config"
 
     if default is not _MISSING:
@@ -861,11 +716,25 @@ def _as_str(value: Any) -> str:
         text = value.strip()
         if not text:
             raise SettingsError("Value cannot be empty.")
-        return text
+        return sys.intern(text)
 
     raise SettingsError("Expected string value.")
 
 
+def _as_provider(value: Any) -> str:
+    provider = sys.intern(_as_str(value).lower())
+    if provider not in _VALID_PROVIDERS:
+        raise SettingsError(_INVALID_PROVIDER_MESSAGE)
+    return provider
+
+
+def _as_log_level(value: Any) -> str:
+    log_level = sys.intern(_as_str(value).upper())
+    if log_level not in _VALID_LOG_LEVELS:
+        raise SettingsError(_INVALID_LOG_LEVEL_MESSAGE)
+    return log_level
+
+
 def _as_optional_str(value: Any) -> Optional[str]:
     if value is None:
         return None
@@ -883,7 +752,7 @@ def _as_int(value: Any) -> int:
         return value
 
     if isinstance(value, str):
-        return int(value.strip())
+        return int(value)
 
     raise SettingsError("Expected integer value.")
 
@@ -896,7 +765,7 @@ def _as_float(value: Any) -> float:
         return float(value)
 
     if isinstance(value, str):
-        return float(value.strip())
+        return float(value)
 
     raise SettingsError("Expected float value.")
 
@@ -906,23 +775,63 @@ def _as_bool(value: Any) -> bool:
         return value
 
     if isinstance(value, str):
-        normalized = value.strip().lower()
-        if normalized in {"1", "true", "yes", "on"}:
-            return True
-        if normalized in {"0", "false", "no", "off"}:
-            return False
+        normalized = value.strip()
+        if not normalized.islower():
+            normalized = normalized.lower()
+        parsed = _BOOL_VALUES.get(normalized)
+        if parsed is not None:
+            return parsed
 
     raise SettingsError("Expected boolean value.")
 
 
 def _as_path(value: Any) -> Path:
     if isinstance(value, Path):
-        return value
+        return value.expanduser()
 
     if isinstance(value, str):
         text = value.strip()
         if not text:
             raise SettingsError("Path value cannot be empty.")
-        return Path(text)
+        return Path(text).expanduser()
 
     raise SettingsError("Expected path string value.")
+
+
+# Plain (key, env_key, caster, default) specs for settings that have no
+# cross-field defaults. Agent settings and discord channels stay hand-wired.
+_SECTION_FIELDS: Mapping[str, Tuple[Tuple[str, str, Callable[[Any], Any], Any], ...]] = {
+    "discord": (
+        ("bot_token_env", "HOMUNCULUS_DISCORD_BOT_TOKEN_ENV", _as_str, "DISCORD_BOT_TOKEN"),
+        ("history_size", "HOMUNCULUS_DISCORD_HISTORY_SIZE", _as_int, 25),
+    ),
+    "model": (
+        ("provider", "HOMUNCULUS_MODEL_PROVIDER", _as_provider, "anthropic"),
+        ("name", "HOMUNCULUS_MODEL_NAME", _as_str, _MISSING),
+        ("api_key_env", "HOMUNCULUS_MODEL_API_KEY_ENV", _as_str, "ANTHROPIC_API_KEY"),
+        ("max_tokens", "HOMUNCULUS_MODEL_MAX_TOKENS", _as_int, 500),
+        ("temperature", "HOMUNCULUS_MODEL_TEMPERATURE", _as_float, 0.7),
+        ("timeout_seconds", "HOMUNCULUS_MODEL_TIMEOUT_SECONDS", _as_float, 30.0),
+        ("base_url", "HOMUNCULUS_MODEL_BASE_URL", _as_optional_str, None),
+        ("agent_id", "HOMUNCULUS_MODEL_AGENT_ID", _as_optional_str, None),
+    ),
+    "memory": (
+        ("qmd_binary", "HOMUNCULUS_MEMORY_QMD_BINARY", _as_str, "qmd"),
+        ("top_k", "HOMUNCULUS_MEMORY_TOP_K", _as_int, 10),
+        ("query_timeout_seconds", "HOMUNCULUS_MEMORY_QUERY_TIMEOUT_SECONDS", _as_float, 4.0),
+        ("fallback_timeout_seconds", "HOMUNCULUS_MEMORY_FALLBACK_TIMEOUT_SECONDS", _as_float, 2.0),
+        ("update_interval_seconds", "HOMUNCULUS_MEMORY_UPDATE_INTERVAL_SECONDS", _as_float, 300.0),
+        ("update_timeout_seconds", "HOMUNCULUS_MEMORY_UPDATE_TIMEOUT_SECONDS", _as_float, 60.0),
+        (
+            "retrieval_cache_ttl_seconds",
+            "HOMUNCULUS_MEMORY_RETRIEVAL_CACHE_TTL_SECONDS",
+            _as_float,
+            30.0,
+        ),
+    ),
+    "runtime": (
+        ("log_level", "HOMUNCULUS_RUNTIME_LOG_LEVEL", _as_log_level, "INFO"),
+        ("data_home", "HOMUNCULUS_RUNTIME_DATA_HOME", _as_path, Path("~/.homunculus")),
+        ("dry_run", "HOMUNCULUS_RUNTIME_DRY_RUN", _as_bool, False),
+    ),
+}
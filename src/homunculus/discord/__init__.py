@@ -1,26 +1,57 @@
-"""Discord-facing utilities."""
-
-from homunculus.discord.client import (
-    ChannelSender,
-    DiscordChannelSender,
-    DiscordClientService,
-    DiscordHistoryProvider,
-    DiscordMessage,
-)
-from homunculus.discord.mention_listener import MentionListener, MessageLike
-from homunculus.discord.message_handler import (
-    DiscordMessageHandler,
-    MultiChannelMessageHandler,
-)
-from homunculus.discord.recent_messages import RecentMessage, RecentMessageCollector
-from homunculus.discord.reply_formatter import ReplyFormatter, ReplyTemplateSettings
-from homunculus.discord.slash_commands import (
-    CommandResponse,
-    CommandValidationError,
-    NpcSlashCommandHandler,
-    NpcStatus,
-    format_command_error,
-)
+"""Discord-facing utilities.
+
+Exports are resolved lazily so importing a single submodule does not pull in
+the Discord client, the response pipeline, or ``discord.py``.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homunculus.discord.client import (
+        ChannelSender,
+        DiscordChannelSender,
+        DiscordClientService,
+        DiscordHistoryProvider,
+        DiscordMessage,
+    )
+    from homunculus.discord.mention_listener import MentionListener, MessageLike
+    from homunculus.discord.message_handler import (
+        DiscordMessageHandler,
+        MultiChannelMessageHandler,
+    )
+    from homunculus.discord.recent_messages import RecentMessage, RecentMessageCollector
+    from homunculus.discord.reply_formatter import ReplyFormatter, ReplyTemplateSettings
+    from homunculus.discord.slash_commands import (
+        CommandResponse,
+        CommandValidationError,
+        NpcSlashCommandHandler,
+        NpcStatus,
+        format_command_error,
+    )
+
+_LAZY_EXPORTS = {
+    "ChannelSender": "homunculus.discord.client",
+    "DiscordChannelSender": "homunculus.discord.client",
+    "DiscordClientService": "homunculus.discord.client",
+    "DiscordHistoryProvider": "homunculus.discord.client",
+    "DiscordMessage": "homunculus.discord.client",
+    "DiscordMessageHandler": "homunculus.discord.message_handler",
+    "MultiChannelMessageHandler": "homunculus.discord.message_handler",
+    "MentionListener": "homunculus.discord.mention_listener",
+    "MessageLike": "homunculus.discord.mention_listener",
+    "RecentMessage": "homunculus.discord.recent_messages",
+    "RecentMessageCollector": "homunculus.discord.recent_messages",
+    "ReplyFormatter": "homunculus.discord.reply_formatter",
+    "ReplyTemplateSettings": "homunculus.discord.reply_formatter",
+    "CommandResponse": "homunculus.discord.slash_commands",
+    "CommandValidationError": "homunculus.discord.slash_commands",
+    "NpcSlashCommandHandler": "homunculus.discord.slash_commands",
+    "NpcStatus": "homunculus.discord.slash_commands",
+    "format_command_error": "homunculus.discord.slash_commands",
+}
 
 __all__ = [
     "ChannelSender",
@@ -42,3 +73,17 @@ __all__ = [
     "NpcStatus",
     "format_command_error",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Callable, Optional, Protocol, Sequence
@@ -13,6 +14,8 @@ try:
 except ImportError:
     discord = None  # type: ignore
 
+_RECENT_MESSAGE_CACHE_SIZE = 128
+
 
 class MessageLike(Protocol):
     """Minimal message contract for pipeline trigger logic."""
@@ -51,7 +54,7 @@ class ChannelSender(Protocol):
         ...
     
     async def stop_typing(self) -> None:
-        """Stop typing indicator (no-op, handled by context manager)."""
+        """Stop typing indicator."""
         ...
 
 
@@ -68,7 +71,7 @@ class OnMessageHandler(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscordMessage:
     """Adapter from discord.Message to our internal protocols."""
 
@@ -87,23 +90,23 @@ class DiscordHistoryProvider:
 
     def __init__(self, channel: "discord.TextChannel") -> None:
         self._channel = channel
+        self._channel_id = channel.id
 
     async def get_recent_messages(self, limit: int) -> Sequence[DiscordMessage]:
-        messages = []
-        async for msg in self._channel.history(limit=limit):
-            messages.append(
-                DiscordMessage(
-                    message_id=msg.id,
-                    channel_id=msg.channel.id,
-                    author_id=msg.author.id,
-                    author_name=msg.author.display_name,
-                    author_is_bot=msg.author.bot,
-                    content=msg.content,
-                    created_at=msg.created_at,
-                    mentioned_user_ids=tuple(user.id for user in msg.mentions),
-                )
+        channel_id = self._channel_id
+        return [
+            DiscordMessage(
+                message_id=msg.id,
+                channel_id=channel_id,
+                author_id=msg.author.id,
+                author_name=msg.author.display_name,
+                author_is_bot=msg.author.bot,
+                content=msg.content,
+                created_at=msg.created_at,
+                mentioned_user_ids=tuple([user.id for user in msg.mentions]),
             )
-        return messages
+            async for msg in self._channel.history(limit=limit)
+        ]
 
 
 class DiscordChannelSender:
@@ -113,38 +116,58 @@ class DiscordChannelSender:
         self._channel = channel
         self._logger = logger or logging.getLogger("homunculus.discord.sender")
         self._typing_task: Optional[asyncio.Task] = None
+        self._typing_holders = 0
+        self._recent_messages: OrderedDict[int, "discord.Message"] = OrderedDict()
 
     async def send_message(self, content: str) -> None:
         await self._channel.send(content)
+
+    def remember_message(self, message: "discord.Message") -> None:
+        """Keep an inbound message so reactions can skip a fetch round-trip."""
+        self._recent_messages[message.id] = message
+        if len(self._recent_messages) > _RECENT_MESSAGE_CACHE_SIZE:
+            self._recent_messages.popitem(last=False)
     
     async def add_reaction(self, message_id: int, emoji: str) -> None:
         """Add a reaction emoji to a message."""
         try:
-            message = await self._channel.fetch_message(message_id)
+            message = self._recent_messages.get(message_id)
+            if message is None:
+                message = await self._channel.fetch_message(message_id)
             await message.add_reaction(emoji)
         except Exception as e:
-            self._logger.warning(f"Failed to add reaction: {e}")
+            self._logger.warning("Failed to add reaction: %s", e)
     
     async def start_typing(self) -> None:
-        """Start typing indicator in the channel."""
-        # Discord typing indicator lasts ~10 seconds, we need to keep refreshing
+        """Start typing indicator in the channel.
+
+        The sender is shared by all messages in a channel, so typing stays on
+        until every ``start_typing`` call has been matched by ``stop_typing``.
+        """
+        # Discord typing indicator lasts ~10 seconds, we need to keep refreshing.
+        # Awaiting typing() sends a single typing request.
         async def _keep_typing():
             while True:
-                async with self._channel.typing():
-                    await asyncio.sleep(8)  # Refresh every 8 seconds
+                await self._channel.typing()
+                await asyncio.sleep(8)  # Refresh every 8 seconds
         
+        self._typing_holders += 1
         if self._typing_task is None or self._typing_task.done():
             self._typing_task = asyncio.create_task(_keep_typing())
     
     async def stop_typing(self) -> None:
         """Stop typing indicator."""
-        if self._typing_task is not None and not self._typing_task.done():
-            self._typing_task.cancel()
+        if self._typing_holders > 0:
+            self._typing_holders -= 1
+        if self._typing_holders:
+            return
+        typing_task, self._typing_task = self._typing_task, None
+        if typing_task is not None and not typing_task.done():
+            typing_task.cancel()
             try:
-                await self._typing_task
+                await typing_task
             except asyncio.CancelledError:
                 pass
-            self._typing_task = None
 
 
 class DiscordClientService:
@@ -201,7 +224,9 @@ class DiscordClientService:
         self._client = discord.Client(intents=intents)
 
         self._ready_event = asyncio.Event()
-        self._target_channels: dict[int, discord.TextChannel] = {}
+        self._history_providers: dict[int, DiscordHistoryProvider] = {}
+        self._senders: dict[int, DiscordChannelSender] = {}
+        self._bot_name_aliases: frozenset[str] = frozenset()
         self._task: Optional[asyncio.Task] = None
 
         # Register event handlers using decorator syntax
@@ -216,9 +241,25 @@ class DiscordClientService:
             await self._on_message(message)
 
     async def start(self) -> None:
-        """Start the Discord client in the background."""
+        """Start the Discord client in the background.
+
+        Startup failures such as an invalid token are re-raised here instead of
+        leaving the caller waiting for a ready event that never comes.
+        """
         self._task = asyncio.create_task(self._client.start(self._bot_token))
-        await self._ready_event.wait()
+        ready_waiter = asyncio.create_task(self._ready_event.wait())
+        try:
+            await asyncio.wait(
+                {ready_waiter, self._task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready_waiter.cancel()
+
+        if not self._ready_event.is_set():
+            await self._task
+            raise RuntimeError("Discord client stopped before becoming ready.")
+
         self._logger.info(
             "Discord client ready: bot_user_id=%s target_channel_ids=%s",
             self._client.user.id if self._client.user else None,
@@ -237,6 +278,10 @@ class DiscordClientService:
     async def _on_ready(self) -> None:
         """Called when the bot successfully connects to Discord."""
         self._logger.info("Discord client connected as %s", self._client.user)
+        if self._client.user is not None:
+            self._bot_name_aliases = frozenset(
+                {self._client.user.name, self._client.user.display_name}
+            )
 
         for channel_id in sorted(self._target_channel_ids):
             channel = self._client.get_channel(channel_id)
@@ -252,7 +297,7 @@ class DiscordClientService:
                     channel_id,
                 )
                 continue
-            self._target_channels[channel_id] = channel
+            self._register_channel(channel_id, channel)
             self._logger.info("Target channel acquired: id=%s name=%s", channel_id, channel.name)
         
         # Invoke ready callback with bot user ID
@@ -271,13 +316,14 @@ class DiscordClientService:
                 return
 
             # Collect user mentions + role mentions (for bots that have same-named roles)
-            mentioned_ids = set(user.id for user in message.mentions)
+            mentioned_ids = [user.id for user in message.mentions]
             if message.role_mentions:
                 bot_user = self._client.user
-                if bot_user:
+                if bot_user and bot_user.id not in mentioned_ids:
                     for role in message.role_mentions:
-                        if role.name == bot_user.name or role.name == bot_user.display_name:
-                            mentioned_ids.add(bot_user.id)
+                        if role.name in self._bot_name_aliases:
+                            mentioned_ids.append(bot_user.id)
+                            break
 
             internal_message = DiscordMessage(
                 message_id=message.id,
@@ -290,24 +336,27 @@ class DiscordClientService:
                 mentioned_user_ids=tuple(mentioned_ids),
             )
 
-            channel = self._target_channels.get(message.channel.id)
-            if channel is None and isinstance(message.channel, discord.TextChannel):
-                channel = message.channel
-                self._target_channels[message.channel.id] = channel
-            if channel is None:
+            channel_id = message.channel.id
+            sender = self._senders.get(channel_id)
+            if sender is None and isinstance(message.channel, discord.TextChannel):
+                self._register_channel(channel_id, message.channel)
+                sender = self._senders[channel_id]
+            if sender is None:
                 self._logger.warning(
                     "Skipping message for target channel_id=%s because channel is unavailable.",
-                    message.channel.id,
+                    channel_id,
                 )
                 return
 
-            history_provider = DiscordHistoryProvider(channel)
-            sender = DiscordChannelSender(channel, logger=self._logger)
-
+            sender.remember_message(message)
             await self._handler.handle(
                 message=internal_message,
-                history_provider=history_provider,
+                history_provider=self._history_providers[channel_id],
                 sender=sender,
             )
         except Exception:
             self._logger.exception("Message handler failed")
+
+    def _register_channel(self, channel_id: int, channel: "discord.TextChannel") -> None:
+        self._history_providers[channel_id] = DiscordHistoryProvider(channel)
+        self._senders[channel_id] = DiscordChannelSender(channel, logger=self._logger)
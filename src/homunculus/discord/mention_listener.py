@@ -46,7 +46,7 @@ class MentionListener:
         # If bot_user_id not set yet, don't respond
         if self.bot_user_id <= 0:
             return False
-        return self.bot_user_id in set(message.mentioned_user_ids)
+        return self.bot_user_id in message.mentioned_user_ids
 
     async def handle_if_triggered(self, message: MessageLike, handler: MentionHandler) -> bool:
         if not self.should_respond(message):
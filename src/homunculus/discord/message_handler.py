@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Mapping, Optional, Protocol
 import logging
 
@@ -13,6 +14,14 @@ from homunculus.pipeline.response_pipeline import ResponsePipeline
 class DiscordMessageHandler:
     """Bridges Discord messages to the response pipeline."""
 
+    __slots__ = (
+        "_character_card",
+        "_logger",
+        "_memory_namespace",
+        "_pipeline",
+        "_skill_ruleset",
+    )
+
     def __init__(
         self,
         *,
@@ -37,20 +46,28 @@ class DiscordMessageHandler:
     ) -> None:
         """Handle a Discord message through the response pipeline."""
         self._logger.info(
-            f"DiscordMessageHandler.handle called: channel={message.channel_id}, "
-            f"author_id={message.author_id}, is_bot={message.author_is_bot}, "
-            f"mentions={message.mentioned_user_ids}"
+            "DiscordMessageHandler.handle called: channel=%s, author_id=%s, is_bot=%s, "
+            "mentions=%s",
+            message.channel_id,
+            message.author_id,
+            message.author_is_bot,
+            message.mentioned_user_ids,
         )
-        
-        # Add checkmark reaction to acknowledge receipt
-        message_id = getattr(message, "message_id", None)
-        if message_id is not None:
-            await sender.add_reaction(message_id, "✅")
-        
-        # Start typing indicator
+
+        # Skip reaction, typing and pipeline work for messages that do not trigger a reply
+        if not self._pipeline.should_respond(message):
+            return
+
+        # Start typing first: it only schedules the refresher task, so its request
+        # overlaps the acknowledgement reaction instead of waiting behind it
         await sender.start_typing()
-        
+
         try:
+            # Add checkmark reaction to acknowledge receipt
+            message_id = getattr(message, "message_id", None)
+            if message_id is not None:
+                await sender.add_reaction(message_id, "✅")
+
             outcome = await self._pipeline.on_message(
                 message=message,
                 history_provider=history_provider,
@@ -62,7 +79,10 @@ class DiscordMessageHandler:
             )
 
             self._logger.info(
-                f"Pipeline outcome: handled={outcome.handled}, sent={outcome.sent}, error={outcome.error_type}"
+                "Pipeline outcome: handled=%s, sent=%s, error=%s",
+                outcome.handled,
+                outcome.sent,
+                outcome.error_type,
             )
             
             if outcome.handled:
@@ -91,6 +111,8 @@ class RoutedMessageHandler(Protocol):
 class MultiChannelMessageHandler:
     """Routes incoming Discord messages to a channel-specific handler."""
 
+    __slots__ = ("_handlers_by_channel", "_logger")
+
     def __init__(
         self,
         *,
@@ -99,7 +121,7 @@ class MultiChannelMessageHandler:
     ) -> None:
         if not handlers_by_channel:
             raise ValueError("handlers_by_channel cannot be empty.")
-        self._handlers_by_channel = dict(handlers_by_channel)
+        self._handlers_by_channel = MappingProxyType(dict(handlers_by_channel))
         self._logger = logger or logging.getLogger("homunculus.discord.multi_handler")
 
     async def handle(
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Protocol, Sequence, Tuple
 
+_MESSAGE_ORDER_KEY = attrgetter("created_at", "message_id")
+
 
 class SourceMessage(Protocol):
     """Message contract expected by the collector."""
@@ -60,10 +63,7 @@ class RecentMessageCollector:
             raise ValueError("limit must be a positive integer.")
 
         raw_messages = await provider.get_recent_messages(effective_limit)
-        ordered = sorted(
-            raw_messages,
-            key=lambda message: (message.created_at, message.message_id),
-        )
+        ordered = sorted(raw_messages, key=_MESSAGE_ORDER_KEY)
         window = ordered[-effective_limit:]
         normalized = []
         for message in window:
@@ -76,7 +76,14 @@ class RecentMessageCollector:
                     role="assistant" if message.author_is_bot else "user",
                     content=message.content,
                     created_at=message.created_at,
-                    mentioned_user_ids=tuple(sorted(set(message.mentioned_user_ids))),
+                    mentioned_user_ids=_dedupe_mentions(message.mentioned_user_ids),
                 )
             )
         return tuple(normalized)
+
+
+def _dedupe_mentions(mentioned_user_ids: Sequence[int]) -> Tuple[int, ...]:
+    # Most messages mention nobody or a single user; skip the set + sort for those.
+    if len(mentioned_user_ids) <= 1:
+        return tuple(mentioned_user_ids)
+    return tuple(sorted(set(mentioned_user_ids)))
@@ -107,6 +107,8 @@ class NpcSlashCommandHandler:
         normalized = value.strip()
         if not normalized:
             raise CommandValidationError("character_card_path cannot be empty.")
+        if not normalized.lower().endswith(".json"):
+            raise CommandValidationError("character_card_path must reference a .json file.")
         path = Path(normalized).expanduser()
         if path.suffix.lower() != ".json":
             raise CommandValidationError("character_card_path must reference a .json file.")
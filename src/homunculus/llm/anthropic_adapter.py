@@ -33,12 +33,16 @@ class AnthropicClientAdapter(LLMClient):
             messages=[{"role": "user", "content": prompt}],
         )
 
-        usage = getattr(response, "usage", None)
+        try:
+            usage = response.usage
+            input_tokens, output_tokens = usage.input_tokens, usage.output_tokens
+        except AttributeError:
+            input_tokens = output_tokens = None
         return CompletionResult(
             text=self._extract_text(response),
             model=model_config.model,
-            input_tokens=getattr(usage, "input_tokens", None),
-            output_tokens=getattr(usage, "output_tokens", None),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
         )
 
     def _build_client(self, model_config: ModelConfig) -> Any:
@@ -66,16 +70,18 @@ class AnthropicClientAdapter(LLMClient):
         if not content:
             return ""
 
-        parts: list[str] = []
-        for block in content:
-            if isinstance(block, dict):
-                if block.get("type") == "text" and isinstance(block.get("text"), str):
-                    parts.append(block["text"])
-                continue
+        if len(content) == 1:
+            return _block_text(content[0])
+        return "".join(map(_block_text, content))
+
 
-            if getattr(block, "type", None) == "text":
-                text = getattr(block, "text", None)
-                if isinstance(text, str):
-                    parts.append(text)
+def _block_text(block: Any) -> str:
+    if isinstance(block, dict):
+        text = block.get("text")
+        return text if block.get("type") == "text" and isinstance(text, str) else ""
 
-        return "".join(parts)
+    if getattr(block, "type", None) == "text":
+        text = getattr(block, "text", None)
+        if isinstance(text, str):
+            return text
+    return ""
@@ -2,19 +2,44 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence, Tuple
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence, Tuple, Union
 import asyncio
 import json
 import logging
 import os
+import re
 import time
 
 from homunculus.config.settings import AppSettings
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads
 
-@dataclass(frozen=True)
+try:
+    _timeout = asyncio.timeout
+except AttributeError:  # pragma: no cover - Python < 3.11
+    try:
+        from async_timeout import timeout as _timeout
+    except ImportError:
+        _timeout = None
+
+_TEXT_KEYS = ("text", "content", "snippet", "body")
+_DOCUMENT_TEXT_KEYS = ("text", "content")
+_SOURCE_KEYS = ("source", "path", "file", "file_path", "uri")
+_NON_WHITESPACE = re.compile(r"\S")
+_JSON_CONTAINER_START = re.compile(r"[ \t\n\r]*[\[{]")
+_JSON_CONTAINER_START_BYTES = re.compile(rb"[ \t\n\r]*[\[{]")
+_DEFAULT_MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
 class MemoryRecord:
     text: str
     source: str
@@ -22,7 +47,7 @@ class MemoryRecord:
     mode: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrievalError:
     type: str
     message: str
@@ -30,7 +55,7 @@ class RetrievalError:
     fallback_error_type: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrievalResult:
     records: Tuple[MemoryRecord, ...]
     mode: Optional[str]
@@ -38,13 +63,14 @@ class RetrievalResult:
     error: Optional[RetrievalError]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CommandResult:
     returncode: int
-    stdout: str
+    stdout: Union[bytes, str]
     stderr: str
     timed_out: bool
     latency_ms: int
+    oversized: bool = False
 
 
 CommandRunner = Callable[[Sequence[str], Mapping[str, str], float], Awaitable[_CommandResult]]
@@ -61,15 +87,27 @@ class QmdAdapter:
         logger: Optional[logging.Logger] = None,
         command_runner: Optional[CommandRunner] = None,
         max_query_chars: int = 600,
+        max_response_bytes: int = _DEFAULT_MAX_RESPONSE_BYTES,
         environ: Optional[Mapping[str, str]] = None,
+        cache_max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._settings = settings
         normalized_namespace = namespace.strip() if namespace is not None else None
         self._namespace = normalized_namespace or None
         self._logger = logger or logging.getLogger("homunculus.memory.qmd")
-        self._command_runner = command_runner or _run_qmd_command
+        self._command_runner = command_runner or partial(
+            _run_qmd_command,
+            max_output_bytes=max_response_bytes,
+        )
         self._max_query_chars = max_query_chars
+        self._max_response_bytes = max_response_bytes
         self._environ = dict(environ) if environ is not None else dict(os.environ)
+        self._env_cache: dict[str, Mapping[str, str]] = {}
+        self._cache_ttl_seconds = settings.memory.retrieval_cache_ttl_seconds
+        self._cache_max_entries = cache_max_entries
+        self._clock = clock
+        self._cache: "OrderedDict[Tuple[str, str, int], Tuple[float, RetrievalResult]]" = OrderedDict()
 
     async def retrieve(
         self,
@@ -113,6 +151,11 @@ class QmdAdapter:
                 error=RetrievalError(type="invalid_top_k", message="top_k must be > 0."),
             )
 
+        cache_key = (effective_namespace, normalized_query, effective_top_k)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         env = self._build_env(effective_namespace)
 
         query_attempt = await self._attempt(
@@ -124,6 +167,7 @@ class QmdAdapter:
         )
         if query_attempt.result is not None:
             self._log_success(mode="query", used_fallback=False, attempt=query_attempt)
+            self._cache_put(cache_key, query_attempt.result)
             return query_attempt.result
 
         fallback_attempt = await self._attempt(
@@ -134,6 +178,8 @@ class QmdAdapter:
             env=env,
         )
         if fallback_attempt.result is not None:
+            # Degraded fallback results are not cached so a recovered query mode
+            # is picked up on the next call.
             self._log_success(mode="search", used_fallback=True, attempt=fallback_attempt)
             return fallback_attempt.result
 
@@ -198,6 +244,18 @@ class QmdAdapter:
                 latency_ms=command_result.latency_ms,
             )
 
+        if command_result.oversized:
+            self._logger.warning(
+                "qmd_retrieval_failure mode=%s error_type=oversize_output latency_ms=%s",
+                mode,
+                command_result.latency_ms,
+            )
+            return _Attempt(
+                result=None,
+                error_type="oversize_output",
+                latency_ms=command_result.latency_ms,
+            )
+
         if command_result.returncode != 0:
             self._logger.warning(
                 "qmd_retrieval_failure mode=%s error_type=non_zero_exit latency_ms=%s",
@@ -211,7 +269,11 @@ class QmdAdapter:
             )
 
         try:
-            records = _parse_records(command_result.stdout, mode=mode)
+            records = _parse_records(
+                command_result.stdout,
+                mode=mode,
+                max_bytes=self._max_response_bytes,
+            )
         except ValueError:
             self._logger.warning(
                 "qmd_retrieval_failure mode=%s error_type=parse_error latency_ms=%s",
@@ -235,14 +297,43 @@ class QmdAdapter:
             latency_ms=command_result.latency_ms,
         )
 
+    def _cache_get(self, key: Tuple[str, str, int]) -> Optional[RetrievalResult]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if self._clock() >= expires_at:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: Tuple[str, str, int], result: RetrievalResult) -> None:
+        if self._cache_ttl_seconds <= 0 or self._cache_max_entries <= 0:
+            return
+
+        self._cache[key] = (self._clock() + self._cache_ttl_seconds, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_max_entries:
+            self._cache.popitem(last=False)
+
     def _build_env(self, namespace: str) -> Mapping[str, str]:
+        cached = self._env_cache.get(namespace)
+        if cached is not None:
+            return cached
+
         qmd_root = self._settings.namespace_root(namespace) / "qmd"
         env = dict(self._environ)
         env["XDG_CONFIG_HOME"] = str(qmd_root / "xdg-config")
         env["XDG_CACHE_HOME"] = str(qmd_root / "xdg-cache")
+        self._env_cache[namespace] = env
         return env
 
     def _log_success(self, *, mode: str, used_fallback: bool, attempt: "_Attempt") -> None:
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         self._logger.info(
             "qmd_retrieval_success mode=%s used_fallback=%s latency_ms=%s records=%s",
             mode,
@@ -252,7 +343,7 @@ class QmdAdapter:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Attempt:
     result: Optional[RetrievalResult]
     error_type: Optional[str]
@@ -260,15 +351,35 @@ class _Attempt:
 
 
 def _normalize_query(query: str, *, max_chars: int) -> str:
-    normalized = query.strip()
-    if len(normalized) <= max_chars:
-        return normalized
-    return normalized[:max_chars].rstrip()
-
+    if len(query) <= max_chars:
+        return query.strip()
+
+    # Long prompts: locate the first non-whitespace character and slice the
+    # capped window directly instead of stripping a full copy first.
+    first = _NON_WHITESPACE.search(query)
+    if first is None:
+        return ""
+    start = first.start()
+    return query[start : start + max_chars].rstrip()
+
+
+def _parse_records(
+    raw_output: Union[bytes, str],
+    *,
+    mode: str,
+    max_bytes: int = _DEFAULT_MAX_RESPONSE_BYTES,
+) -> Tuple[MemoryRecord, ...]:
+    if len(raw_output) > max_bytes:
+        raise ValueError("qmd output exceeds the response size limit")
+
+    container_start = (
+        _JSON_CONTAINER_START_BYTES if isinstance(raw_output, bytes) else _JSON_CONTAINER_START
+    )
+    if container_start.match(raw_output) is None:
+        raise ValueError("qmd output is not a JSON object or array")
 
-def _parse_records(raw_output: str, *, mode: str) -> Tuple[MemoryRecord, ...]:
     try:
-        payload = json.loads(raw_output)
+        payload = _json_loads(raw_output)
     except json.JSONDecodeError as exc:
         raise ValueError("qmd output is not valid JSON") from exc
 
@@ -286,58 +397,36 @@ def _parse_records(raw_output: str, *, mode: str) -> Tuple[MemoryRecord, ...]:
         raise ValueError("qmd output has unsupported JSON shape")
 
     records = []
+    append = records.append
+    record_type = MemoryRecord
     for item in items:
         if not isinstance(item, Mapping):
             continue
 
-        text = _pick_text(item)
+        text, source, score = _extract_row(item)
         if not text:
             continue
-
-        source = _pick_source(item)
-        score = _to_float(item.get("score"))
-        records.append(
-            MemoryRecord(
-                text=text,
-                source=source,
-                score=score,
-                mode=mode,
-            )
-        )
+        append(record_type(text=text, source=source, score=score, mode=mode))
     return tuple(records)
 
 
-def _pick_text(item: Mapping[str, Any]) -> str:
-    direct = _first_non_empty_str(
-        item.get("text"),
-        item.get("content"),
-        item.get("snippet"),
-        item.get("body"),
-    )
-    if direct:
-        return direct
-
-    document = item.get("document")
-    if isinstance(document, Mapping):
-        nested = _first_non_empty_str(document.get("text"), document.get("content"))
-        if nested:
-            return nested
-    return ""
-
+def _extract_row(item: Mapping[str, Any]) -> Tuple[str, str, float]:
+    text = _first_non_empty_field(item, _TEXT_KEYS)
+    if not text:
+        document = item.get("document")
+        if isinstance(document, Mapping):
+            text = _first_non_empty_field(document, _DOCUMENT_TEXT_KEYS)
+        if not text:
+            return "", "", 0.0
 
-def _pick_source(item: Mapping[str, Any]) -> str:
-    source = _first_non_empty_str(
-        item.get("source"),
-        item.get("path"),
-        item.get("file"),
-        item.get("file_path"),
-        item.get("uri"),
-    )
-    return source if source else "unknown"
+    source = _first_non_empty_field(item, _SOURCE_KEYS) or "unknown"
+    return text, source, _to_float(item.get("score"))
 
 
-def _first_non_empty_str(*values: Any) -> str:
-    for value in values:
+def _first_non_empty_field(item: Mapping[str, Any], keys: Tuple[str, ...]) -> str:
+    get = item.get
+    for key in keys:
+        value = get(key)
         if isinstance(value, str):
             normalized = value.strip()
             if normalized:
@@ -362,38 +451,91 @@ async def _run_qmd_command(
     args: Sequence[str],
     env: Mapping[str, str],
     timeout_seconds: float,
+    *,
+    max_output_bytes: int = _DEFAULT_MAX_RESPONSE_BYTES,
 ) -> _CommandResult:
     started = time.perf_counter()
     process = await asyncio.create_subprocess_exec(
         *args,
-        env=dict(env),
+        env=env,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
 
     try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            process.communicate(),
-            timeout=timeout_seconds,
-        )
+        if _timeout is not None:
+            async with _timeout(timeout_seconds):
+                stdout_bytes, stderr_bytes = await _communicate_capped(process, max_output_bytes)
+        else:  # pragma: no cover - Python < 3.11 without async_timeout
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                _communicate_capped(process, max_output_bytes),
+                timeout=timeout_seconds,
+            )
         timed_out = False
     except asyncio.TimeoutError:
-        process.kill()
-        await process.communicate()
+        _kill(process)
+        await _communicate_capped(process, max_output_bytes)
         latency_ms = int((time.perf_counter() - started) * 1000)
         return _CommandResult(
             returncode=-1,
-            stdout="",
+            stdout=b"",
             stderr="",
             timed_out=True,
             latency_ms=latency_ms,
         )
 
     latency_ms = int((time.perf_counter() - started) * 1000)
+    if stdout_bytes is None or stderr_bytes is None:
+        return _CommandResult(
+            returncode=-1,
+            stdout=b"",
+            stderr="",
+            timed_out=False,
+            latency_ms=latency_ms,
+            oversized=True,
+        )
+
     return _CommandResult(
         returncode=process.returncode,
-        stdout=stdout_bytes.decode("utf-8", errors="replace"),
+        stdout=stdout_bytes,
         stderr=stderr_bytes.decode("utf-8", errors="replace"),
         timed_out=timed_out,
         latency_ms=latency_ms,
     )
+
+
+async def _communicate_capped(
+    process: asyncio.subprocess.Process,
+    limit: int,
+) -> Tuple[Optional[bytes], Optional[bytes]]:
+    stdout_bytes, stderr_bytes = await asyncio.gather(
+        _read_capped(process, process.stdout, limit),
+        _read_capped(process, process.stderr, limit),
+    )
+    await process.wait()
+    return stdout_bytes, stderr_bytes
+
+
+async def _read_capped(
+    process: asyncio.subprocess.Process,
+    stream: asyncio.StreamReader,
+    limit: int,
+) -> Optional[bytes]:
+    chunks = []
+    size = 0
+    while True:
+        chunk = await stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            return b"".join(chunks)
+        size += len(chunk)
+        if size > limit:
+            _kill(process)
+            return None
+        chunks.append(chunk)
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass
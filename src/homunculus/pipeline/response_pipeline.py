@@ -98,6 +98,10 @@ class ResponsePipeline:
         self._history_limit = history_limit
         self._logger = logger or logging.getLogger("homunculus.pipeline.response")
 
+    def should_respond(self, message: MessageLike) -> bool:
+        """Cheap pre-check so callers can skip acknowledgement work for ignored messages."""
+        return self._listener.should_respond(message)
+
     async def on_message(
         self,
         *,
@@ -112,10 +116,15 @@ class ResponsePipeline:
     ) -> PipelineOutcome:
         should_respond = self._listener.should_respond(message)
         self._logger.info(
-            f"MentionListener check: should_respond={should_respond}, "
-            f"target_channel={self._listener.target_channel_id}, msg_channel={message.channel_id}, "
-            f"bot_user_id={self._listener.bot_user_id}, author_id={message.author_id}, "
-            f"author_is_bot={message.author_is_bot}, mentions={message.mentioned_user_ids}"
+            "MentionListener check: should_respond=%s, target_channel=%s, msg_channel=%s, "
+            "bot_user_id=%s, author_id=%s, author_is_bot=%s, mentions=%s",
+            should_respond,
+            self._listener.target_channel_id,
+            message.channel_id,
+            self._listener.bot_user_id,
+            message.author_id,
+            message.author_is_bot,
+            message.mentioned_user_ids,
         )
         
         if not should_respond:
@@ -179,7 +188,7 @@ class ResponsePipeline:
                 )
             )
         except LlmClientError as exc:
-            self._logger.exception(f"llm_completion_failed: {exc}")
+            self._logger.exception("llm_completion_failed: %s", exc)
             return PipelineOutcome(
                 handled=True,
                 sent=False,
@@ -156,8 +156,11 @@ def _bootstrap_namespace_storage(*, settings: AppSettings, namespace: str) -> No
         directory.mkdir(parents=True, exist_ok=True)
 
     memory_file = root / "memory" / "MEMORY.md"
-    if not memory_file.exists():
-        memory_file.write_text("# MEMORY\n\n", encoding="utf-8")
+    try:
+        with memory_file.open("x", encoding="utf-8") as handle:
+            handle.write("# MEMORY\n\n")
+    except FileExistsError:
+        pass
 
 
 def create_hotswap_manager(
@@ -106,6 +106,17 @@ class AnthropicClientAdapterTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(captured["api_key"], "secret-key")
         self.assertEqual(len(fake_client.messages.calls), 1)
 
+    async def test_complete_tolerates_missing_usage(self) -> None:
+        response = _FakeResponse(content=[{"type": "text", "text": "ok"}])
+        response.usage = None
+        adapter = AnthropicClientAdapter(client=_FakeClient(response))
+
+        result = await adapter.complete("Ping", ModelConfig(provider="anthropic", model="m"))
+
+        self.assertEqual(result.text, "ok")
+        self.assertIsNone(result.input_tokens)
+        self.assertIsNone(result.output_tokens)
+
     async def test_complete_rejects_non_anthropic_provider(self) -> None:
         adapter = AnthropicClientAdapter(
             client=_FakeClient(_FakeResponse(content=[{"type": "text", "text": "ok"}]))
@@ -153,6 +164,13 @@ class AnthropicClientAdapterTests(unittest.IsolatedAsyncioTestCase):
         text = AnthropicClientAdapter._extract_text(response)
         self.assertEqual(text, "hello world")
 
+    def test_extract_text_single_block(self) -> None:
+        text_block = _FakeResponse(content=[_FakeContentBlock(type="text", text="solo")])
+        tool_block = _FakeResponse(content=[{"type": "tool_use", "id": "x"}])
+
+        self.assertEqual(AnthropicClientAdapter._extract_text(text_block), "solo")
+        self.assertEqual(AnthropicClientAdapter._extract_text(tool_block), "")
+
 
 if __name__ == "__main__":
     unittest.main()
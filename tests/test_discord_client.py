@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from homunculus.discord import client as client_module
+from homunculus.discord.client import (
+    DiscordChannelSender,
+    DiscordClientService,
+    DiscordHistoryProvider,
+)
+
+
+class _Channel:
+    def __init__(self, history=()):
+        self.id = 555
+        self.typing_requests = 0
+        self._history = history
+        self.history_limits = []
+        self.fetched_ids = []
+
+    async def typing(self):
+        self.typing_requests += 1
+
+    async def fetch_message(self, message_id):
+        self.fetched_ids.append(message_id)
+        return _Message(message_id)
+
+    async def history(self, *, limit):
+        self.history_limits.append(limit)
+        for message in self._history[:limit]:
+            yield message
+
+
+class _Message:
+    def __init__(self, message_id):
+        self.id = message_id
+        self.reactions = []
+
+    async def add_reaction(self, emoji):
+        self.reactions.append(emoji)
+
+
+class DiscordChannelSenderTests(unittest.IsolatedAsyncioTestCase):
+    async def test_shared_sender_keeps_typing_until_last_stop(self):
+        channel = _Channel()
+        sender = DiscordChannelSender(channel)
+
+        await sender.start_typing()
+        await sender.start_typing()
+        await asyncio.sleep(0)
+        typing_task = sender._typing_task
+
+        await sender.stop_typing()
+        self.assertFalse(typing_task.done())
+
+        await sender.stop_typing()
+        self.assertTrue(typing_task.done())
+        self.assertIsNone(sender._typing_task)
+        self.assertEqual(channel.typing_requests, 1)
+
+    async def test_reaction_uses_remembered_message_before_fetching(self):
+        channel = _Channel()
+        sender = DiscordChannelSender(channel)
+        remembered = _Message(10)
+        sender.remember_message(remembered)
+
+        await sender.add_reaction(10, "✅")
+        await sender.add_reaction(11, "✅")
+
+        self.assertEqual(remembered.reactions, ["✅"])
+        self.assertEqual(channel.fetched_ids, [11])
+
+    async def test_unmatched_stop_is_a_no_op(self):
+        sender = DiscordChannelSender(_Channel())
+
+        await sender.stop_typing()
+
+        self.assertIsNone(sender._typing_task)
+
+
+class DiscordHistoryProviderTests(unittest.IsolatedAsyncioTestCase):
+    async def test_get_recent_messages_adapts_history(self):
+        created_at = datetime(2026, 2, 14, tzinfo=timezone.utc)
+        raw = SimpleNamespace(
+            id=1,
+            author=SimpleNamespace(id=42, display_name="Keeper", bot=False),
+            content="hello",
+            created_at=created_at,
+            mentions=[SimpleNamespace(id=7), SimpleNamespace(id=8)],
+        )
+        channel = _Channel(history=[raw, raw])
+        provider = DiscordHistoryProvider(channel)
+
+        messages = await provider.get_recent_messages(1)
+
+        self.assertEqual(channel.history_limits, [1])
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].channel_id, 555)
+        self.assertEqual(messages[0].author_name, "Keeper")
+        self.assertEqual(messages[0].mentioned_user_ids, (7, 8))
+        self.assertEqual(messages[0].created_at, created_at)
+
+
+class _Intents:
+    @classmethod
+    def default(cls):
+        return cls()
+
+
+class _StubClient:
+    start_behaviour = None
+
+    def __init__(self, *, intents):
+        self.intents = intents
+        self.user = None
+        self.events = {}
+
+    def event(self, handler):
+        self.events[handler.__name__] = handler
+        return handler
+
+    async def start(self, token):
+        await self.start_behaviour(token)
+
+    async def close(self):
+        return None
+
+
+def _stub_discord(start_behaviour):
+    client_class = type("_Client", (_StubClient,), {"start_behaviour": staticmethod(start_behaviour)})
+    return SimpleNamespace(Intents=_Intents, Client=client_class, TextChannel=_Channel)
+
+
+class _Handler:
+    async def handle(self, **_kwargs):
+        return None
+
+
+class DiscordClientServiceStartTests(unittest.IsolatedAsyncioTestCase):
+    def _service(self, start_behaviour):
+        with mock.patch.object(client_module, "discord", _stub_discord(start_behaviour)):
+            return DiscordClientService(
+                bot_token="token",
+                target_channel_id=555,
+                on_message_handler=_Handler(),
+            )
+
+    async def test_start_reraises_client_startup_failure(self):
+        async def _fail(_token):
+            raise PermissionError("improper token")
+
+        service = self._service(_fail)
+
+        with self.assertRaisesRegex(PermissionError, "improper token"):
+            await service.start()
+
+    async def test_start_raises_when_client_stops_before_ready(self):
+        async def _return_immediately(_token):
+            return None
+
+        service = self._service(_return_immediately)
+
+        with self.assertRaisesRegex(RuntimeError, "stopped before becoming ready"):
+            await service.start()
+
+
+if __name__ == "__main__":
+    unittest.main()
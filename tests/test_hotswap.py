@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+import asyncio
 import sys
 import tempfile
 import unittest
@@ -113,6 +114,58 @@ class HotSwapTests(unittest.IsolatedAsyncioTestCase):
 
             self.assertEqual(manager.current_identity.npc_name, "kovach")
 
+    async def test_swapping_back_and_forth_keeps_every_archive(self):
+        kovach = AgentIdentity(
+            npc_name="kovach",
+            character_card_path=Path("./cards/kovach.json"),
+            qmd_index="kovach",
+        )
+        eliza = AgentIdentity(
+            npc_name="eliza",
+            character_card_path=Path("./cards/eliza.json"),
+            qmd_index="eliza",
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_home = Path(temp_dir)
+            (data_home / "agents" / "kovach" / "memory").mkdir(parents=True)
+            manager = AgentIdentityManager(data_home=data_home, initial_identity=kovach)
+
+            results = [
+                await manager.hot_swap(eliza),
+                await manager.hot_swap(kovach),
+                await manager.hot_swap(eliza),
+            ]
+
+            archive_dirs = [result.archive_dir for result in results]
+            self.assertEqual(len(set(archive_dirs)), 3)
+            for archive_dir in archive_dirs:
+                self.assertTrue((archive_dir / "memory").is_dir())
+            self.assertEqual(manager.current_identity.npc_name, "eliza")
+
+    async def test_concurrent_swaps_are_serialized(self):
+        identities = [
+            AgentIdentity(
+                npc_name=name,
+                character_card_path=Path(f"./cards/{name}.json"),
+                qmd_index=name,
+            )
+            for name in ("kovach", "eliza", "john")
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_home = Path(temp_dir)
+            (data_home / "agents" / "kovach" / "memory").mkdir(parents=True)
+            manager = AgentIdentityManager(data_home=data_home, initial_identity=identities[0])
+
+            first, second = await asyncio.gather(
+                manager.hot_swap(identities[1]),
+                manager.hot_swap(identities[2]),
+            )
+
+            self.assertEqual(first.old_identity.npc_name, "kovach")
+            self.assertEqual(second.old_identity.npc_name, "eliza")
+            self.assertNotEqual(first.archive_dir, second.archive_dir)
+            self.assertEqual(manager.current_identity.npc_name, "john")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -40,8 +40,12 @@ class _Sender:
 
 
 class _Pipeline:
-    def __init__(self) -> None:
+    def __init__(self, *, responds: bool = True) -> None:
         self.calls = []
+        self.responds = responds
+
+    def should_respond(self, _message) -> bool:
+        return self.responds
 
     async def on_message(self, **kwargs):
         self.calls.append(kwargs)
@@ -122,6 +126,27 @@ class MessageHandlerTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(pipeline.calls[0]["npc_name"], "Kovach")
         self.assertEqual(pipeline.calls[0]["memory_namespace"], "kovach-campaign-a")
 
+    async def test_discord_message_handler_skips_untriggered_message(self):
+        pipeline = _Pipeline(responds=False)
+        handler = DiscordMessageHandler(character_card=_card(), pipeline=pipeline)
+
+        sender = _Sender()
+        await handler.handle(
+            message=_Message(
+                message_id=43,
+                channel_id=200,
+                author_id=100,
+                author_is_bot=False,
+                mentioned_user_ids=[],
+            ),
+            history_provider=_HistoryProvider(),
+            sender=sender,
+        )
+
+        self.assertEqual(sender.reactions, [])
+        self.assertEqual(sender.started, 0)
+        self.assertEqual(pipeline.calls, [])
+
     async def test_multi_channel_handler_routes_by_channel_id(self):
         handler_a = _RoutingHandler()
         handler_b = _RoutingHandler()
@@ -147,6 +172,28 @@ class MessageHandlerTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(handler_a.calls, [])
         self.assertEqual(handler_b.calls, [201])
 
+    async def test_multi_channel_handler_snapshots_routing_table(self):
+        handler_a = _RoutingHandler()
+        handlers_by_channel = {200: handler_a}
+        router = MultiChannelMessageHandler(handlers_by_channel=handlers_by_channel)
+        handlers_by_channel[201] = _RoutingHandler()
+
+        with self.assertLogs("homunculus.discord.multi_handler", level="WARNING"):
+            await router.handle(
+                message=_Message(
+                    message_id=3,
+                    channel_id=201,
+                    author_id=102,
+                    author_is_bot=False,
+                    mentioned_user_ids=[],
+                ),
+                history_provider=_HistoryProvider(),
+                sender=_Sender(),
+            )
+
+        with self.assertRaises(TypeError):
+            router._handlers_by_channel[201] = handler_a
+
     async def test_multi_channel_handler_ignores_unknown_channel(self):
         handler_a = _RoutingHandler()
         router = MultiChannelMessageHandler(
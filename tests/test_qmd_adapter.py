@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+import os
 import sys
 import unittest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from homunculus.config.settings import load_settings
-from homunculus.memory.qmd_adapter import QmdAdapter, _CommandResult
+from homunculus.memory.qmd_adapter import QmdAdapter, _CommandResult, _run_qmd_command
 
 
 class QmdAdapterTests(unittest.IsolatedAsyncioTestCase):
@@ -146,6 +147,201 @@ class QmdAdapterTests(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(result.error)
         self.assertEqual(captured_query["value"], "abcdefghij")
 
+    async def test_raw_bytes_output_is_parsed_without_decoding(self):
+        async def _runner(_args, _env, _timeout):
+            return _CommandResult(
+                returncode=0,
+                stdout='[{"text":"schön","path":"memory/2024.md"}]'.encode("utf-8"),
+                stderr="",
+                timed_out=False,
+                latency_ms=3,
+            )
+
+        adapter = QmdAdapter(settings=self._settings(), command_runner=_runner)
+        result = await adapter.retrieve("umlaut")
+
+        self.assertIsNone(result.error)
+        self.assertEqual(result.records[0].text, "schön")
+        self.assertEqual(result.records[0].source, "memory/2024.md")
+
+    async def test_env_is_built_once_per_namespace(self):
+        envs = []
+
+        async def _runner(_args, env, _timeout):
+            envs.append(env)
+            return _CommandResult(
+                returncode=0,
+                stdout="[]",
+                stderr="",
+                timed_out=False,
+                latency_ms=1,
+            )
+
+        adapter = QmdAdapter(
+            settings=self._settings(),
+            command_runner=_runner,
+            environ={"PATH": "/usr/bin"},
+        )
+        await adapter.retrieve("first")
+        await adapter.retrieve("second")
+
+        self.assertEqual(len(envs), 2)
+        self.assertIs(envs[0], envs[1])
+        self.assertEqual(envs[0]["PATH"], "/usr/bin")
+
+    async def test_repeated_query_is_served_from_cache_until_ttl_expires(self):
+        calls = []
+        now = {"value": 100.0}
+
+        async def _runner(args, _env, _timeout):
+            calls.append(args[-1])
+            return _CommandResult(
+                returncode=0,
+                stdout='[{"text":"fact"}]',
+                stderr="",
+                timed_out=False,
+                latency_ms=4,
+            )
+
+        adapter = QmdAdapter(
+            settings=self._settings(),
+            command_runner=_runner,
+            clock=lambda: now["value"],
+        )
+        first = await adapter.retrieve("hello there")
+        second = await adapter.retrieve("  hello there  ")
+
+        self.assertIs(first, second)
+        self.assertEqual(calls, ["hello there"])
+
+        now["value"] += 31.0
+        await adapter.retrieve("hello there")
+        self.assertEqual(len(calls), 2)
+
+    async def test_failed_retrieval_is_not_cached(self):
+        calls = []
+
+        async def _runner(args, _env, _timeout):
+            calls.append(args[1])
+            return _CommandResult(
+                returncode=1,
+                stdout="",
+                stderr="failure",
+                timed_out=False,
+                latency_ms=2,
+            )
+
+        adapter = QmdAdapter(settings=self._settings(), command_runner=_runner)
+        await adapter.retrieve("critical question")
+        await adapter.retrieve("critical question")
+
+        self.assertEqual(calls, ["query", "search", "query", "search"])
+
+    async def test_fallback_result_is_not_cached(self):
+        calls = []
+
+        async def _runner(args, _env, _timeout):
+            calls.append(args[1])
+            if args[1] == "query" and calls.count("query") == 1:
+                return _CommandResult(
+                    returncode=1,
+                    stdout="",
+                    stderr="failure",
+                    timed_out=False,
+                    latency_ms=2,
+                )
+            return _CommandResult(
+                returncode=0,
+                stdout='[{"text":"fact"}]',
+                stderr="",
+                timed_out=False,
+                latency_ms=4,
+            )
+
+        adapter = QmdAdapter(settings=self._settings(), command_runner=_runner)
+        degraded = await adapter.retrieve("critical question")
+        recovered = await adapter.retrieve("critical question")
+
+        self.assertEqual(degraded.mode, "search")
+        self.assertEqual(recovered.mode, "query")
+        self.assertEqual(calls, ["query", "search", "query"])
+
+    async def test_non_json_and_oversized_output_are_parse_errors(self):
+        async def _runner(args, _env, _timeout):
+            stdout = b"Loading index...\n[]" if args[1] == "query" else b"[" + b" " * 64 + b"]"
+            return _CommandResult(
+                returncode=0,
+                stdout=stdout,
+                stderr="",
+                timed_out=False,
+                latency_ms=1,
+            )
+
+        adapter = QmdAdapter(
+            settings=self._settings(),
+            command_runner=_runner,
+            max_response_bytes=32,
+        )
+        result = await adapter.retrieve("anything")
+
+        self.assertEqual(result.error.type, "both_failed")
+        self.assertEqual(result.error.query_error_type, "parse_error")
+        self.assertEqual(result.error.fallback_error_type, "parse_error")
+
+    async def test_oversized_command_output_is_reported(self):
+        async def _runner(args, _env, _timeout):
+            if args[1] == "query":
+                return _CommandResult(
+                    returncode=-1,
+                    stdout=b"",
+                    stderr="",
+                    timed_out=False,
+                    latency_ms=9,
+                    oversized=True,
+                )
+            return _CommandResult(
+                returncode=0,
+                stdout=b'[{"text":"small"}]',
+                stderr="",
+                timed_out=False,
+                latency_ms=3,
+            )
+
+        adapter = QmdAdapter(settings=self._settings(), command_runner=_runner)
+        result = await adapter.retrieve("anything")
+
+        self.assertIsNone(result.error)
+        self.assertEqual(result.mode, "search")
+        self.assertEqual(result.records[0].text, "small")
+
+
+class RunQmdCommandTests(unittest.IsolatedAsyncioTestCase):
+    async def test_stderr_overflow_is_reported_as_oversized(self):
+        result = await _run_qmd_command(
+            [sys.executable, "-c", "import sys; sys.stderr.write('x' * 4096)"],
+            dict(os.environ),
+            10,
+            max_output_bytes=1024,
+        )
+
+        self.assertTrue(result.oversized)
+        self.assertFalse(result.timed_out)
+
+    async def test_timeout_kills_process_and_reports_timeout(self):
+        result = await _run_qmd_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys, time; sys.stdout.write('x' * 100); sys.stdout.flush(); time.sleep(30)",
+            ],
+            dict(os.environ),
+            0.5,
+            max_output_bytes=1024,
+        )
+
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.stdout, b"")
+
 
 if __name__ == "__main__":
     unittest.main()
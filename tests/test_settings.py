@@ -1,16 +1,21 @@
 import json
+import os
 from pathlib import Path
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from homunculus.config.settings import (
     SettingsError,
+    clear_settings_cache,
     load_settings,
     migrate_legacy_config,
     resolve_env_secret,
+    settings_summary,
+    settings_summary_json,
 )
 
 
@@ -36,6 +41,14 @@ class SettingsLoaderTests(unittest.TestCase):
         self.assertEqual(settings.model.provider, "anthropic")
         self.assertEqual(settings.discord.history_size, 25)
 
+    def test_default_data_home_expands_home_at_load_time(self):
+        with tempfile.TemporaryDirectory() as home:
+            with mock.patch.dict(os.environ, {"HOME": home}):
+                clear_settings_cache()
+                settings = load_settings(environ=self._minimal_env())
+
+        self.assertEqual(settings.runtime.data_home, Path(home) / ".homunculus")
+
     def test_environment_overrides_config_file(self):
         config = {
             "agent": {
@@ -74,6 +87,31 @@ class SettingsLoaderTests(unittest.TestCase):
         with self.assertRaises(SettingsError):
             load_settings(environ=env)
 
+    def test_blank_character_card_path_raises_settings_error(self):
+        env = self._minimal_env()
+        env["HOMUNCULUS_AGENT_CHARACTER_CARD_PATH"] = "   "
+
+        with self.assertRaises(SettingsError):
+            load_settings(environ=env)
+
+    def test_overflowing_float_raises_settings_error(self):
+        config = {
+            "agent": {
+                "npc_name": "kovach",
+                "character_card_path": "./card.json",
+                "qmd_index": "kovach",
+            },
+            "discord": {"channel_id": 100},
+            "model": {"name": "claude-sonnet-4-5-20250929", "temperature": 10**400},
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+            config_path.write_text(json.dumps(config), encoding="utf-8")
+
+            with self.assertRaises(SettingsError):
+                load_settings(config_path=config_path, environ={})
+
     def test_resolve_env_secret(self):
         secret = resolve_env_secret("DISCORD_BOT_TOKEN", {"DISCORD_BOT_TOKEN": "token"})
         self.assertEqual(secret, "token")
@@ -110,6 +148,47 @@ class SettingsLoaderTests(unittest.TestCase):
         self.assertEqual(settings.discord.channel_ids, (111, 222))
         self.assertEqual(settings.discord.channels[1].memory_namespace, "john")
 
+    def test_load_settings_is_memoized_until_inputs_change(self):
+        config = {
+            "agent": {
+                "npc_name": "kovach",
+                "character_card_path": "./card.json",
+                "qmd_index": "kovach",
+            },
+            "discord": {"channel_id": 100},
+            "model": {"name": "claude-sonnet-4-5-20250929"},
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.json"
+            config_path.write_text(json.dumps(config), encoding="utf-8")
+
+            first = load_settings(config_path=config_path, environ={"PATH": "/bin"})
+            second = load_settings(config_path=config_path, environ={"PATH": "/usr/bin"})
+            self.assertIs(first, second)
+
+            clear_settings_cache()
+            self.assertIsNot(load_settings(config_path=config_path, environ={}), first)
+
+            overridden = load_settings(
+                config_path=config_path,
+                environ={"HOMUNCULUS_MODEL_MAX_TOKENS": "64"},
+            )
+            self.assertEqual(overridden.model.max_tokens, 64)
+
+            config["model"]["max_tokens"] = 128
+            config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+            reloaded = load_settings(config_path=config_path, environ={})
+            self.assertEqual(reloaded.model.max_tokens, 128)
+
+    def test_settings_summary_json_is_memoized(self):
+        settings = load_settings(environ=self._minimal_env())
+
+        encoded = settings_summary_json(settings)
+
+        self.assertIs(encoded, settings_summary_json(settings))
+        self.assertEqual(json.loads(encoded), settings_summary(settings))
+
     def test_migrate_legacy_config(self):
         old_config = {
             "agent": {